@@ -7,7 +7,13 @@
 # [shift + delete] to move the current image into a '_deleted' folder.
 # [escape] to exit the app.
 
+import bisect
+import collections
+import concurrent.futures
+import functools
+import hashlib
 import sys
+import time
 import tkinter as tk
 import traceback
 from random import random
@@ -16,52 +22,129 @@ from typing import Generator
 
 from PIL import Image, ImageTk
 
-# enchant needs PYENCHANT_LIBRARY_PATH=/opt/homebrew/lib/libenchant-2.2.dylib
+# on macOS with Homebrew, enchant needs pointing at the Homebrew dylib -
+# but only there, and only if the user hasn't already set a path; forcing
+# it elsewhere sends enchant down a slow failed-dlopen fallback
 import os
-os.environ["PYENCHANT_LIBRARY_PATH"]="/opt/homebrew/lib/libenchant-2.2.dylib"
+_HOMEBREW_ENCHANT = "/opt/homebrew/lib/libenchant-2.2.dylib"
+if sys.platform == 'darwin' and 'PYENCHANT_LIBRARY_PATH' not in os.environ \
+        and os.path.exists(_HOMEBREW_ENCHANT):
+    os.environ["PYENCHANT_LIBRARY_PATH"] = _HOMEBREW_ENCHANT
 from enchant import Dict, tokenize
 
 from pathlib import Path
 
-IMG_EXT = ["jpg", "jpeg", "png"]
+IMG_EXT = frozenset({"jpg", "jpeg", "png"})
 
-class CaptionedImage():
-    def __init__(self, image_path):
-        self.base_path = image_path.parent
-        self.path = image_path
-    
-    def caption_path(self):
-        return self.base_path / (self.path.stem + '.txt')
-
-    def read_caption(self):
-        caption_path = self.caption_path()
-        if caption_path.exists():
-            with open(caption_path, 'r', encoding='utf-8', newline='') as f:
-                return f.read()
+# separator between captions in the concatenated search haystack - a control
+# character that can't appear in typed caption text
+HAYSTACK_SEP = '\x1f'
+
+THUMBNAIL_CACHE_DIR = '.cache'
+THUMBNAIL_BUCKET = 64 # px - bucket thumbnail sizes so small frame resizes share cache entries
+
+PHOTO_CACHE_SIZE = 32 # recently shown ImageTk.PhotoImage handles kept alive
+
+@functools.lru_cache(maxsize=64)
+def _load_thumbnail(path_str, mtime, w_bucket, h_bucket, cache_dir):
+    """Load an image scaled to fit the bucketed size. Results live in this
+    LRU keyed on (path, mtime, size bucket) and are also persisted as small
+    jpegs in cache_dir, so revisiting an image skips the full-size decode."""
+    w = max(THUMBNAIL_BUCKET, w_bucket * THUMBNAIL_BUCKET)
+    h = max(THUMBNAIL_BUCKET, h_bucket * THUMBNAIL_BUCKET)
+    digest = hashlib.sha1(f"{path_str}:{mtime}".encode('utf-8')).hexdigest()
+    thumb_path = os.path.join(cache_dir, f"{digest}_{w}x{h}.jpg")
+    if os.path.exists(thumb_path):
+        try:
+            return Image.open(thumb_path)
+        except OSError:
+            pass # corrupt cache entry - fall through and regenerate
+    img = Image.open(path_str)
+    if img.width > w or img.height > h:
+        # for jpegs, draft decodes at 1/2, 1/4 or 1/8 scale before thumbnail
+        # does the final resize
+        img.draft('RGB', (w, h))
+        if img.width > w or img.height > h:
+            # BILINEAR is ~3x faster than the default BICUBIC and looks the
+            # same at preview sizes
+            img.thumbnail((w, h), Image.Resampling.BILINEAR)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            img.convert('RGB').save(thumb_path, 'JPEG', quality=85)
+        except OSError:
+            pass
+    return img
+
+# caption sidecar helpers - images are stored as plain path strings (see
+# ImageView._paths), so these work on strings and only build a Path for I/O
+def _caption_path(path_str):
+    return os.path.splitext(path_str)[0] + '.txt'
+
+def _read_caption(path_str):
+    try:
+        # read_text skips the buffered-reader setup, which dominates the
+        # cost of reading files this small; catching the error also saves
+        # the exists() stat
+        return Path(_caption_path(path_str)).read_text(encoding='utf-8')
+    except FileNotFoundError:
         return ''
 
-    def write_caption(self, caption):
-        caption_path = self.caption_path()
-        with open(str(caption_path), 'w', encoding='utf-8', newline='') as f:
-            f.write(caption)
-    
-    # sort
-    def __lt__(self, other):
-        return str(self.path).lower() < str(other.path).lower()
+def _write_caption(path_str, caption):
+    Path(_caption_path(path_str)).write_text(caption, encoding='utf-8', newline='')
 
 # adapted from https://stackoverflow.com/a/66281314
 class SpellcheckText(tk.Text):
     locale = 'en_US'
+    delay = 500 # ms between last modification and the spell check running
     def __init__(self, master, **kwargs):
         self.afterid = None
+        self._typing_ts = 0.0
         self.corpus = Dict(self.locale)
+        # corpus.check is an FFI call into libenchant and captions repeat
+        # words heavily, so memoize it (cache_clear() if the dict changes)
+        self._check = functools.lru_cache(maxsize=4096)(self.corpus.check)
         self.tokenize = tokenize.get_tokenizer(self.locale)
+        # lines touched since the last spell check (None = nothing pending,
+        # on_modified falls back to checking the whole buffer)
+        self.min_dirty_line = None
+        self.max_dirty_line = None
+        # tokenizing + corpus.check runs off the Tk thread; _check_gen lets
+        # stale results from superseded checks be dropped on arrival
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._check_gen = 0
+        # misspelling spans keyed by hash of the line's text, so identical
+        # lines (re-pasted or revisited captions) skip tokenization entirely
+        self._line_cache = {}
         super(SpellcheckText, self).__init__(master, **kwargs)
         self._proxy = self._w + "_proxy"
         self.tk.call("rename", self._w, self._proxy)
         self.tk.createcommand(self._w, self._proxycmd)
         self.tag_configure('sic', foreground='red')
         self.bind('<<TextModified>>', self.on_modify)
+        self.bind('<KeyPress>', self._note_typing, add=True)
+        self.bind('<KeyRelease>', self._note_typing, add=True)
+
+    def _note_typing(self, event):
+        self._typing_ts = time.monotonic()
+
+    def prewarm_async(self, texts):
+        """Queue every unique word in texts through the spell checker so the
+        first in-editor check hits the lru_cache instead of cold libenchant
+        lookups. The work runs on the same single-worker executor as the
+        regular checks - neither pyenchant nor libenchant guarantees thread
+        safety, so every call into them has to stay on that one thread."""
+        self._executor.submit(self._prewarm, texts)
+
+    def _prewarm(self, texts):
+        try:
+            words = set()
+            for text in texts:
+                for word, _pos in self.tokenize(text):
+                    words.add(word)
+            for word in words:
+                self._check(word)
+        except Exception as e:
+            print(e)
 
     def _proxycmd(self, command, *args):
         """Intercept the Tk commands to the text widget and if eny of the content
@@ -81,42 +164,132 @@ class SpellcheckText(tk.Text):
         cmd = (self._proxy, command)
         if args:
             cmd = cmd + args
+        if command in ('insert', 'delete', 'replace'):
+            # resolve the target index before the edit moves it
+            dirty = self._dirty_lines_for_edit(command, args)
         try:
             result = self.tk.call(cmd)
         except tk.TclError:
             traceback.print_exc()
             return
         if command in ('insert', 'delete', 'replace'):
+            self._mark_dirty(dirty)
             self.event_generate('<<TextModified>>')
         return result
 
+    def _dirty_lines_for_edit(self, command, args):
+        """Work out which line(s) an insert/delete/replace touches. Returns a
+        (first, last) line pair, or None if the indices can't be parsed (in
+        which case the whole buffer is re-checked)."""
+        try:
+            first = int(self.index(args[0]).split('.')[0])
+            last = first
+            if command == 'insert':
+                # inserted text may span multiple lines
+                last += sum(a.count('\n') for a in args[1::2])
+            elif command == 'replace':
+                last += sum(a.count('\n') for a in args[2::2])
+            return first, last
+        except (tk.TclError, IndexError, ValueError):
+            return None
+
+    def _mark_dirty(self, dirty):
+        if dirty is None:
+            # unknown edit - force a full re-check
+            self.min_dirty_line = 1
+            self.max_dirty_line = sys.maxsize
+        else:
+            first, last = dirty
+            if self.min_dirty_line is not None:
+                first = min(first, self.min_dirty_line)
+                last = max(last, self.max_dirty_line)
+            self.min_dirty_line = first
+            self.max_dirty_line = last
+
     def on_modify(self, event):
-        """Rate limit the spell-checking with a 500ms delay. If another modification
-        event comes in within this time, cancel the after call and re-schedule."""
+        """Rate limit the spell-checking. If a check is already scheduled leave
+        it pending - on_modified pushes itself back while keys are still being
+        pressed, which coalesces a burst of edits into a single check."""
         try:
-            delay = 200 # ms
-            if self.afterid:
-                self.after_cancel(self.afterid)
-            self.afterid = self.after(delay, self.on_modified)
+            if self.afterid is None:
+                self.afterid = self.after(self.delay, self.on_modified)
         except Exception as e:
             print(e)
 
     def on_modified(self):
-        """Handle the spell check once modification pauses.
-        The tokenizer works on lines and yields a list of (word, column) pairs
-        So iterate over the words and set a sic tag on each spell check failed word."""
+        """Kick off the spell check once modification pauses.
+        Only the lines touched since the last run are re-checked - typically
+        just the line being typed on, regardless of caption length. The text
+        of those lines is snapshotted here and handed to a worker thread so
+        the Tk event loop stays responsive; the worker posts its results back
+        via after_idle."""
+        if time.monotonic() - self._typing_ts < 0.15:
+            # a key is still held down (keyrepeat) - don't stall mid-burst,
+            # push the check back instead
+            self.afterid = self.after(self.delay, self.on_modified)
+            return
         self.afterid = None
-        self.tag_remove('sic', '1.0', 'end')
         num_lines = [int(val) for val in self.index("end").split(".")][0]
-        for line in range(1, num_lines):
-            data = self.get(f"{line}.0 linestart", f"{line}.0 lineend")
-            for word,pos in self.tokenize(data):
-                check = self.corpus.check(word)
-                #print(f"{word},{pos},{check}")
-                if not check:
-                    start = f"{line}.{pos}"
-                    end = f"{line}.{pos + len(word)}"
-                    self.tag_add("sic", start, end)
+        if self.min_dirty_line is None:
+            first, last = 1, num_lines - 1
+        else:
+            first = max(1, self.min_dirty_line)
+            last = min(self.max_dirty_line, num_lines - 1)
+        self.min_dirty_line = None
+        self.max_dirty_line = None
+        lines = [(line, self.get(f"{line}.0 linestart", f"{line}.0 lineend"))
+                 for line in range(first, last + 1)]
+        self._check_gen += 1
+        self._executor.submit(self._check_lines, self._check_gen, lines)
+
+    def _check_lines(self, gen, lines):
+        """Worker-thread half of the spell check: tokenize the snapshotted
+        lines and collect misspellings. Doesn't touch Tk.
+        Lines without a cached result are joined and tokenized in a single
+        pass - one tokenizer invocation regardless of line count - and the
+        word offsets are mapped back to (line, column) via the line starts."""
+        try:
+            uncached = [(line, data) for line, data in lines
+                        if hash(data) not in self._line_cache]
+            new_spans = {}
+            if uncached:
+                blob = '\n'.join(data for _, data in uncached)
+                starts = [0]
+                for _, data in uncached[:-1]:
+                    starts.append(starts[-1] + len(data) + 1)
+                spans_per_line = [[] for _ in uncached]
+                for word, offset in self.tokenize(blob):
+                    if not self._check(word):
+                        i = bisect.bisect_right(starts, offset) - 1
+                        spans_per_line[i].append((offset - starts[i], len(word)))
+                for (_, data), spans in zip(uncached, spans_per_line):
+                    new_spans[hash(data)] = spans
+                    if len(self._line_cache) >= 2048:
+                        # drop the oldest entry (dicts keep insertion order)
+                        self._line_cache.pop(next(iter(self._line_cache)))
+                    self._line_cache[hash(data)] = spans
+            misspellings = []
+            for line, data in lines:
+                line_hash = hash(data)
+                spans = self._line_cache.get(line_hash)
+                if spans is None:
+                    spans = new_spans.get(line_hash, ())
+                misspellings.extend((line, pos, length) for pos, length in spans)
+            if gen == self._check_gen:
+                self.after_idle(self._apply_sic_tags, gen,
+                                [line for line,_ in lines], misspellings)
+        except Exception as e:
+            print(e)
+
+    def _apply_sic_tags(self, gen, lines, misspellings):
+        """Main-thread half of the spell check: retag the checked lines.
+        Stale results from a superseded check are dropped."""
+        if gen != self._check_gen:
+            return
+        for line in lines:
+            self.tag_remove('sic', f"{line}.0", f"{line}.0 lineend")
+        for line, pos, length in misspellings:
+            self.tag_add("sic", f"{line}.{pos}", f"{line}.{pos + length}")
 
 
 class ImageView(tk.Frame):
@@ -126,9 +299,27 @@ class ImageView(tk.Frame):
 
         self.root = root
         self.base_path = None
-        self.images = []
+        self._trash_path = None # created on first delete, then reused
+        # a flat list of image path strings rather than per-image objects -
+        # for big folders this keeps the working set small and makes bulk
+        # operations (sort, shuffle, index rebuild) single passes over strings
+        self._paths = []
         self.index = 0
         self.search_text = ''
+        # lazily-read captions keyed by image index, so repeated searches
+        # don't re-read every .txt file
+        self._caption_cache = {}
+        # all captions joined with HAYSTACK_SEP plus the start offset of each
+        # caption, built lazily on first search and patched in place on
+        # caption writes/deletes (_index_dirty forces a lazy rebuild)
+        self._haystack = None
+        self._offsets = None
+        self._index_dirty = False
+        # warms the thumbnail cache for the next/prev images while idle
+        self._prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # LRU of PhotoImage handles keyed by (index, size bucket) - skips the
+        # Pillow->Tk pixmap upload when revisiting an image
+        self._photo_cache = collections.OrderedDict()
 
         # image
         self.image_frame = tk.Frame(self)
@@ -152,30 +343,64 @@ class ImageView(tk.Frame):
         self.base_path = Path(dir)
         if self.base_path is None:
             return
-        self.images.clear()
-        for directory, _, filenames in os.walk(dir):
-            image_filenames = [f for f in filenames if os.path.splitext(f)[1] in IMG_EXT]
-            for filename in image_filenames:
-                self.images.append(CaptionedImage(Path(os.path.join(directory,filename))))
-        self.images.sort()
+        self._trash_path = None
+        self._paths.clear()
+        # recurse with os.scandir rather than os.walk - the DirEntry objects
+        # carry the file type from the dirent, so no per-file stat is needed
+        stack = [dir]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # skip hidden folders, in particular the thumbnail cache
+                        if not entry.name.startswith('.'):
+                            stack.append(entry.path)
+                    elif entry.name.rpartition('.')[2].lower() in IMG_EXT \
+                            and entry.is_file(follow_symlinks=False):
+                        self._paths.append(entry.path)
+        # key= lowercases each path once instead of twice per comparison
+        self._paths.sort(key=str.lower)
+        self._caption_cache.clear()
+        self._photo_cache.clear()
+        self._haystack = None
         self.update_ui()
+        # warm the spellcheck cache with the folder's existing vocabulary so
+        # the first edit doesn't pay cold libenchant lookups
+        self._prefetch_executor.submit(self._prewarm_spellcheck)
+
+    def _prewarm_spellcheck(self):
+        try:
+            # only the caption file reads happen here on the prefetch worker;
+            # the enchant calls run on the spell checker's own single thread
+            self.caption_field.prewarm_async(list(self.load_all_captions()))
+        except Exception as e:
+            print(e)
 
     def shuffle_images(self):
         self.store_caption()
-        random.shuffle(self.images)
+        random.shuffle(self._paths)
+        self._caption_cache.clear()
+        self._photo_cache.clear()
+        self._haystack = None
         self.set_index(0)
         self.update_ui()
 
     def store_caption(self):
         txt = self.caption_field.get(1.0, tk.END)
         txt = txt.replace('\r', '').replace('\n', '').strip()
-        self.images[self.index].write_caption(txt)
+        _write_caption(self._paths[self.index], txt)
+        self._caption_cache[self.index] = txt
+        self._patch_search_index(self.index, txt)
         
     def set_index(self, index):
-        self.index = index % len(self.images)
+        self.index = index % len(self._paths)
 
     def go_to_image(self, index):
-        if len(self.images) == 0:
+        if len(self._paths) == 0:
             return
         self.store_caption()
         self.set_index(index)
@@ -189,48 +414,93 @@ class ImageView(tk.Frame):
 
     # move current image to a "_deleted" folder
     def delete_image(self):
-        if len(self.images) == 0:
+        if len(self._paths) == 0:
             return
-        img = self.images[self.index]
-
-        trash_path = self.base_path / '_deleted'
-        if not trash_path.exists():
-            trash_path.mkdir()
-        img.path.rename(trash_path / img.path.name)
-        caption_path = img.caption_path()
-        if caption_path.exists():
-            caption_path.rename(trash_path / caption_path.name)
-        del self.images[self.index]
+        path = self._paths[self.index]
+
+        if self._trash_path is None:
+            # exist_ok saves the separate exists() stat, and caching the path
+            # means later deletes skip the mkdir entirely
+            trash_path = self.base_path / '_deleted'
+            trash_path.mkdir(exist_ok=True)
+            self._trash_path = str(trash_path)
+        trash_path = self._trash_path
+        os.replace(path, os.path.join(trash_path, os.path.basename(path)))
+        caption_path = _caption_path(path)
+        try:
+            os.replace(caption_path,
+                       os.path.join(trash_path, os.path.basename(caption_path)))
+        except FileNotFoundError:
+            pass # no caption sidecar for this image
+        self._drop_from_search_index(self.index)
+        del self._paths[self.index]
+        # indices after the deleted image shift down
+        self._caption_cache.clear()
+        self._photo_cache.clear()
         self.set_index(self.index)
         self.update_ui()
     
+    def load_thumbnail(self, index, w, h):
+        path = self._paths[index]
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = 0
+        cache_dir = str(self.base_path / THUMBNAIL_CACHE_DIR)
+        return _load_thumbnail(path, mtime,
+                               w // THUMBNAIL_BUCKET, h // THUMBNAIL_BUCKET,
+                               cache_dir)
+
     def update_ui(self):
-        if (len(self.images)) == 0:
+        if (len(self._paths)) == 0:
             self.filename.set('')
             self.caption_field.delete(1.0, tk.END)
             self.image_label.configure(image=None)
             return
-        img = self.images[self.index]
         # filename
-        title = self.images[self.index].path.name if len(self.images) > 0 else ''
-        self.root.title(title + f' ({self.index+1}/{len(self.images)})')
+        title = os.path.basename(self._paths[self.index]) if len(self._paths) > 0 else ''
+        self.root.title(title + f' ({self.index+1}/{len(self._paths)})')
         # caption
         self.caption_field.edit_reset()
         self.caption_field.edit_modified()
         self.caption_field.delete(1.0, tk.END)
-        self.caption_field.insert(tk.END, img.read_caption())
+        self.caption_field.insert(tk.END, _read_caption(self._paths[self.index]))
         self.caption_field.edit_reset()
-        # image
-        img = Image.open(self.images[self.index].path)
-        
-        # scale the image to fit inside the frame
+        # image, scaled to fit inside the frame via the thumbnail cache
         w = self.image_frame.winfo_width()
         h = self.image_frame.winfo_height()
-        if img.width > w or img.height > h:
-            img.thumbnail((w, h))
-        photoImage = ImageTk.PhotoImage(img)
+        key = (self.index, w // 32, h // 32)
+        photoImage = self._photo_cache.get(key)
+        if photoImage is None:
+            img = self.load_thumbnail(self.index, w, h)
+            photoImage = ImageTk.PhotoImage(img)
+            self._photo_cache[key] = photoImage
+            if len(self._photo_cache) > PHOTO_CACHE_SIZE:
+                self._photo_cache.popitem(last=False)
+        else:
+            self._photo_cache.move_to_end(key)
         self.image_label.configure(image=photoImage)
         self.image_label.image = photoImage
+        # hide the decode latency of the likely next navigation targets
+        self.root.after_idle(self._prefetch, self.index + 1)
+        self.root.after_idle(self._prefetch, self.index - 1)
+
+    def _prefetch(self, index):
+        if len(self._paths) < 2:
+            return
+        self._prefetch_executor.submit(self._prefetch_worker,
+                                       index % len(self._paths),
+                                       self.image_frame.winfo_width(),
+                                       self.image_frame.winfo_height())
+
+    def _prefetch_worker(self, index, w, h):
+        try:
+            n = len(self._paths)
+            if n == 0 or index not in ((self.index + 1) % n, (self.index - 1) % n):
+                return # the user has already navigated elsewhere
+            self.load_thumbnail(index, w, h)
+        except Exception as e:
+            print(e)
 
     def open_find_ui(self, reverse=False):
         title = "Find in captions"
@@ -242,49 +512,108 @@ class ImageView(tk.Frame):
         else:
             self.find_next()
 
+    def get_caption(self, index):
+        caption = self._caption_cache.get(index)
+        if caption is None:
+            caption = _read_caption(self._paths[index])
+            self._caption_cache[index] = caption
+        return caption
+
     def load_all_captions(self) -> Generator[str, None, None]:
-        for i in self.images:
-            yield i.read_caption()
+        for i in range(len(self._paths)):
+            yield self.get_caption(i)
+
+    def _ensure_search_index(self):
+        """Build the concatenated caption haystack and the start offset of
+        each caption within it. One C-level str.find over the whole folder
+        beats a Python-level `in` check per caption file."""
+        if self._haystack is not None and not self._index_dirty:
+            return
+        captions = list(self.load_all_captions())
+        self._offsets = [0]
+        for caption in captions:
+            self._offsets.append(self._offsets[-1] + len(caption) + 1)
+        self._haystack = HAYSTACK_SEP.join(captions)
+        self._index_dirty = False
+
+    def _patch_search_index(self, index, new_caption):
+        """Splice an updated caption into the haystack in place so a caption
+        write doesn't force a full index rebuild on the next search."""
+        if self._haystack is None or self._index_dirty:
+            return
+        if not 0 <= index < len(self._offsets) - 1:
+            self._index_dirty = True
+            return
+        start = self._offsets[index]
+        old_len = self._offsets[index + 1] - start - 1
+        self._haystack = self._haystack[:start] + new_caption \
+                         + self._haystack[start + old_len:]
+        delta = len(new_caption) - old_len
+        if delta:
+            for i in range(index + 1, len(self._offsets)):
+                self._offsets[i] += delta
+
+    def _drop_from_search_index(self, index):
+        """Remove one caption (and its separator) from the haystack."""
+        if self._haystack is None or self._index_dirty:
+            return
+        if not 0 <= index < len(self._offsets) - 1:
+            self._index_dirty = True
+            return
+        start = self._offsets[index]
+        length = self._offsets[index + 1] - start # caption plus one separator
+        if index == len(self._offsets) - 2:
+            # last caption - drop the separator before it instead
+            self._haystack = self._haystack[:max(0, start - 1)]
+        else:
+            self._haystack = self._haystack[:start] + self._haystack[start + length:]
+        self._offsets = self._offsets[:index] \
+                        + [offset - length for offset in self._offsets[index + 1:]]
 
     def find_next(self):
-        if len(self.images) == 0:
+        if len(self._paths) == 0:
             return
         if len(self.search_text) == 0:
             self.open_find_ui()
         else:
-            start_index = ((self.index+1) % len(self.images))
-            end_index = len(self.images)
+            start_index = ((self.index+1) % len(self._paths))
+            end_index = len(self._paths)
             self.find_next_internal(start_index, end_index, reverse=False)
 
     def find_prev(self):
-        if len(self.images) == 0:
+        if len(self._paths) == 0:
             return
         if len(self.search_text) == 0:
             self.open_find_ui(reverse=True)
         else:
             # prev search is just a next search with the indices reversed
-            end_index = (self.index+len(self.images)-1) % len(self.images)
+            end_index = (self.index+len(self._paths)-1) % len(self._paths)
             start_index = 0
             self.find_next_internal(start_index, end_index, reverse=True)
 
     def find_next_internal(self, start_index, end_index, reverse=False, wrap=True):
         print(f"find_next_internal from {start_index} to {end_index}, reverse:{reverse}, wrap:{wrap}")
-        captions = list(self.load_all_captions())
         if start_index >= end_index:
             raise ValueError(f"start index {start_index} must be < end index {end_index}")
-        try:
-            print('searching ')
-            indices = range(start_index, end_index)
-            if reverse:
-                indices = reversed(indices)
-            next_index = next(i for i in indices if self.search_text in captions[i])
+        print('searching ')
+        self._ensure_search_index()
+        # a single C-level find/rfind over the caption haystack; matches
+        # can't cross captions because HAYSTACK_SEP is untypeable
+        start_char = self._offsets[start_index]
+        end_char = self._offsets[end_index] - 1
+        if reverse:
+            pos = self._haystack.rfind(self.search_text, start_char, end_char)
+        else:
+            pos = self._haystack.find(self.search_text, start_char, end_char)
+        if pos >= 0:
+            next_index = bisect.bisect_right(self._offsets, pos) - 1
             print(f"going to {next_index}")
             self.go_to_image(next_index)
-        except StopIteration:
+        else:
             # loop, but don't loop forever
             if wrap:
                 if reverse:
-                    self.find_next_internal(start_index=end_index, end_index=len(self.images), reverse=True, wrap=False)
+                    self.find_next_internal(start_index=end_index, end_index=len(self._paths), reverse=True, wrap=False)
                 else:
                     self.find_next_internal(start_index=0, end_index=start_index, reverse=False, wrap=False)
 
@@ -310,7 +639,7 @@ if __name__=='__main__':
     root.bind('<Shift-Prior>', lambda e: view.go_to_image(view.index - 10))
     root.bind('<Shift-Next>', lambda e: view.go_to_image(view.index + 10))
     root.bind('<Shift-Home>', lambda e: view.go_to_image(0))
-    root.bind('<Shift-End>', lambda e: view.go_to_image(len(view.images) - 1))
+    root.bind('<Shift-End>', lambda e: view.go_to_image(len(view._paths) - 1))
     root.bind('<Shift-Delete>', lambda e: view.delete_image())
     root.bind('<Command-l>', lambda e: view.shuffle_images())
 